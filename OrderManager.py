@@ -1,7 +1,10 @@
 # order_manager.py
 import json
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Tuple
+
+from Paging import paginate
+from RWLock import RWLock, NullLock
 
 
 class OrderManager:
@@ -20,11 +23,16 @@ class OrderManager:
         "by_who": str,       # which staff member
         "date": str,         # e.g. "2025-01-31"
         "status": str,       # "open", "ordered", "received", "won", etc.
-        "notes": str
+        "notes": str,
+        "total": float       # agreed price, used for outstanding balances
     }
+
+    thread_safe=True guards the order list with a reader/writer lock so
+    background threads can share the manager with the GUI. Updates
+    replace the order dict, so get_all() / get_by_kind() return snapshots.
     """
 
-    def __init__(self, filename: str = "orders.json"):
+    def __init__(self, filename: str = "orders.json", thread_safe: bool = False):
         # data/ folder next to script or exe
         base_dir = Path(".").resolve()
         data_dir = base_dir / "data"
@@ -32,6 +40,7 @@ class OrderManager:
 
         self.filepath: Path = data_dir / filename
         self.orders: List[Dict] = []
+        self._lock = RWLock() if thread_safe else NullLock()
         self._load()
 
     # ---------- internal helpers ----------
@@ -66,11 +75,32 @@ class OrderManager:
     # ---------- public API ----------
 
     def get_all(self) -> List[Dict]:
-        return list(self.orders)
+        with self._lock.read_lock():
+            return list(self.orders)
 
     def get_by_kind(self, kind: str) -> List[Dict]:
         kind = kind.lower()
-        return [o for o in self.orders if o.get("kind") == kind]
+        with self._lock.read_lock():
+            return [o for o in self.orders if o.get("kind") == kind]
+
+    def page(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        sort_key: str = "id",
+        descending: bool = False,
+        where: Optional[Callable[[Dict], bool]] = None,
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Return (orders, next_cursor) for one page sorted by `sort_key`,
+        optionally filtered by `where`. The cursor stays valid while other
+        orders are added or deleted; it is None on the last page.
+        """
+        # filter a snapshot outside the lock so `where` may call back into the manager
+        with self._lock.read_lock():
+            snapshot = list(self.orders)
+        return paginate(snapshot, limit, cursor, offset, sort_key, descending, where)
 
     def add_order(
         self,
@@ -82,37 +112,43 @@ class OrderManager:
         date: str,
         status: str,
         notes: str = "",
+        total: float = 0.0,
     ) -> Dict:
-        order = {
-            "id": self._next_id(),
-            "kind": kind.lower(),
-            "title": title,
-            "contact": contact,
-            "from_where": from_where,
-            "by_who": by_who,
-            "date": date,
-            "status": status,
-            "notes": notes,
-        }
-        self.orders.append(order)
-        self._save()
-        return order
+        with self._lock.write_lock():
+            order = {
+                "id": self._next_id(),
+                "kind": kind.lower(),
+                "title": title,
+                "contact": contact,
+                "from_where": from_where,
+                "by_who": by_who,
+                "date": date,
+                "status": status,
+                "notes": notes,
+                "total": float(total),
+            }
+            self.orders.append(order)
+            self._save()
+            return order
 
     def update_order(self, order_id: int, **fields) -> Dict:
-        idx = self._find_index(order_id)
-        if idx is None:
-            raise KeyError(f"No order with id {order_id}")
-        self.orders[idx].update(fields)
-        self._save()
-        return self.orders[idx]
+        with self._lock.write_lock():
+            idx = self._find_index(order_id)
+            if idx is None:
+                raise KeyError(f"No order with id {order_id}")
+            self.orders[idx] = {**self.orders[idx], **fields}
+            self._save()
+            return self.orders[idx]
 
     def delete_order(self, order_id: int) -> None:
-        idx = self._find_index(order_id)
-        if idx is None:
-            raise KeyError(f"No order with id {order_id}")
-        del self.orders[idx]
-        self._save()
+        with self._lock.write_lock():
+            idx = self._find_index(order_id)
+            if idx is None:
+                raise KeyError(f"No order with id {order_id}")
+            del self.orders[idx]
+            self._save()
 
     def get_order(self, order_id: int) -> Optional[Dict]:
-        idx = self._find_index(order_id)
-        return self.orders[idx] if idx is not None else None
+        with self._lock.read_lock():
+            idx = self._find_index(order_id)
+            return self.orders[idx] if idx is not None else None
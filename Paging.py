@@ -0,0 +1,106 @@
+# paging.py
+import heapq
+import json
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def _sort_value(value) -> Tuple:
+    # Fields can hold mixed types (update_item accepts anything), so rank
+    # numbers before strings before everything else instead of comparing
+    # e.g. str with int directly.
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (0, value)
+    if isinstance(value, str):
+        return (1, value)
+    return (2, "" if value is None else str(value))
+
+
+def _sort_tuple(record: Dict, sort_key: str) -> Tuple:
+    # id breaks ties so every record has a unique position
+    return _sort_value(record.get(sort_key)) + (record["id"],)
+
+
+def encode_cursor(record: Dict, sort_key: str, descending: bool) -> str:
+    """Build a continuation token pointing just after `record`."""
+    after = list(_sort_tuple(record, sort_key))
+    return json.dumps({"sort_key": sort_key, "desc": descending, "after": after})
+
+
+def decode_cursor(cursor: str, sort_key: str, descending: bool) -> Tuple:
+    """Turn a continuation token back into a sort tuple."""
+    try:
+        data = json.loads(cursor)
+        rank, value, record_id = data["after"]
+    except (ValueError, KeyError, TypeError):
+        raise ValueError("Invalid page cursor") from None
+
+    # the values must match what _sort_value produces, or comparing them
+    # against real records would raise TypeError
+    value_ok = {
+        0: isinstance(value, (int, float)) and not isinstance(value, bool),
+        1: isinstance(value, str),
+        2: isinstance(value, str),
+    }
+    if (
+        not isinstance(rank, int)
+        or isinstance(rank, bool)
+        or rank not in value_ok
+        or not value_ok[rank]
+        or not isinstance(record_id, int)
+        or isinstance(record_id, bool)
+    ):
+        raise ValueError("Invalid page cursor")
+
+    if data.get("sort_key") != sort_key or bool(data.get("desc")) != descending:
+        raise ValueError("Page cursor was created with a different sort order")
+    return (rank, value, record_id)
+
+
+def paginate(
+    records: Iterable[Dict],
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+    sort_key: str = "id",
+    descending: bool = False,
+    where: Optional[Callable[[Dict], bool]] = None,
+) -> Tuple[List[Dict], Optional[str]]:
+    """
+    Return (page, next_cursor) from `records`.
+
+    A cursor continues right after the last record of the previous page,
+    so records inserted or deleted elsewhere don't shift pages the way an
+    offset would. `offset` is only used when no cursor is given. Only the
+    records needed for the page are kept (heap select, not a full sort).
+    next_cursor is None on the last page.
+    """
+    if limit <= 0:
+        raise ValueError("limit must be greater than zero")
+    if offset < 0:
+        raise ValueError("offset must not be negative")
+
+    if cursor is not None:
+        after = decode_cursor(cursor, sort_key, descending)
+        offset = 0
+    else:
+        after = None
+
+    def candidates():
+        for record in records:
+            if where is not None and not where(record):
+                continue
+            if after is not None:
+                key = _sort_tuple(record, sort_key)
+                if (key <= after) if not descending else (key >= after):
+                    continue
+            yield record
+
+    # one extra record tells us whether another page exists
+    wanted = offset + limit + 1
+    select = heapq.nlargest if descending else heapq.nsmallest
+    selected = select(wanted, candidates(), key=lambda r: _sort_tuple(r, sort_key))
+
+    page = selected[offset:offset + limit]
+    has_more = len(selected) > offset + limit
+    next_cursor = encode_cursor(page[-1], sort_key, descending) if has_more and page else None
+    return page, next_cursor
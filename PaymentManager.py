@@ -0,0 +1,229 @@
+# payment_manager.py
+import bisect
+import json
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
+from datetime import datetime
+
+from OrderManager import OrderManager
+from RWLock import RWLock, NullLock
+
+
+class PaymentManager:
+    """
+    Append-only payments ledger for sale orders, stored as JSON Lines
+    (one entry per line) so recording a payment never rewrites the file.
+
+    Each entry:
+    {
+        "id": int,
+        "order_id": int,     # OrderManager order id (kind = "sale")
+        "kind": str,         # "deposit" | "payment" | "refund"
+        "amount": float,     # signed: refunds are stored negative
+        "method": str,       # "cash", "card", "transfer", ...
+        "date": str,         # e.g. "2025-01-31"
+        "created_at": str,   # full ISO timestamp
+        "notes": str
+    }
+
+    Entries are never edited or deleted - mistakes are corrected with a
+    refund. Running totals per order and per day are kept up to date on
+    every entry, so balance lookups don't scan the ledger.
+    """
+
+    KINDS = ("deposit", "payment", "refund")
+
+    def __init__(
+        self,
+        order_manager: OrderManager,
+        filepath: str = "data/payments.jsonl",
+        thread_safe: bool = False,
+    ):
+        self.order_manager = order_manager
+        self.filepath = Path(filepath)
+        self.entries: List[Dict] = []
+        self._ids: List[int] = []      # ids of `entries`, ascending, for bisect
+        self._paid_by_order: Dict[int, float] = {}
+        self._takings_by_day: Dict[str, float] = {}
+        self._max_id = 0
+        self._lock = RWLock() if thread_safe else NullLock()
+        self._load()
+
+    # ---------- internal helpers ----------
+
+    def _load(self) -> None:
+        """Load the ledger and rebuild the running totals."""
+        self.entries = []
+        self._ids = []
+        self._paid_by_order = {}
+        self._takings_by_day = {}
+        self._max_id = 0
+        if not self.filepath.exists():
+            return
+
+        data = self.filepath.read_bytes()
+        good_end = 0        # byte offset just past the last line that parsed
+        broken_tail = False
+        pos = 0
+        for raw in data.splitlines(keepends=True):
+            pos += len(raw)
+            line = raw.strip()
+            if not line:
+                good_end = pos
+                continue
+            try:
+                entry = json.loads(line.decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                # a half-written line after a crash - skip it
+                broken_tail = True
+                continue
+            broken_tail = False
+            good_end = pos
+            if self._is_valid(entry):
+                self._apply(entry)
+            elif isinstance(entry, dict) and isinstance(entry.get("id"), int):
+                # skipped, but its id still counts as used
+                self._max_id = max(self._max_id, entry["id"])
+
+        # get_page bisects on ids, so keep them ascending even if the file
+        # was edited by hand
+        if any(a > b for a, b in zip(self._ids, self._ids[1:])):
+            self.entries.sort(key=lambda e: e["id"])
+            self._ids = [e["id"] for e in self.entries]
+
+        # Cut off a half-written last line and make sure the file ends with a
+        # newline, otherwise the next append would be glued onto it and lost.
+        if broken_tail:
+            with self.filepath.open("r+b") as f:
+                f.truncate(good_end)
+            data = data[:good_end]
+        if data and not data.endswith(b"\n"):
+            with self.filepath.open("ab") as f:
+                f.write(b"\n")
+
+    @staticmethod
+    def _is_valid(entry) -> bool:
+        """Check a loaded entry has the fields the running totals need."""
+        return (
+            isinstance(entry, dict)
+            and isinstance(entry.get("id"), int)
+            and isinstance(entry.get("order_id"), int)
+            and isinstance(entry.get("amount"), (int, float))
+            and isinstance(entry.get("date"), str)
+        )
+
+    @staticmethod
+    def _order_total(order: Dict) -> float:
+        """An order's total, treating a missing or invalid value as 0.0."""
+        try:
+            return float(order.get("total") or 0.0)
+        except (TypeError, ValueError):
+            return 0.0
+
+    def _append(self, entry: Dict) -> None:
+        """Write one entry to the end of the ledger file."""
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        with self.filepath.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    def _apply(self, entry: Dict) -> None:
+        """Add an entry to the in-memory ledger and running totals."""
+        self.entries.append(entry)
+        self._ids.append(entry["id"])
+        self._max_id = max(self._max_id, entry["id"])
+        amount = entry["amount"]
+        order_id = entry["order_id"]
+        self._paid_by_order[order_id] = round(self._paid_by_order.get(order_id, 0.0) + amount, 2)
+        day = entry["date"]
+        self._takings_by_day[day] = round(self._takings_by_day.get(day, 0.0) + amount, 2)
+
+    def _next_id(self) -> int:
+        return self._max_id + 1
+
+    # ---------- public API ----------
+
+    def add_entry(
+        self,
+        order_id: int,
+        amount: float,
+        kind: str = "payment",
+        method: str = "",
+        notes: str = "",
+        date: Optional[str] = None,
+    ) -> Dict:
+        """
+        Record a deposit, part-payment or refund against a sale order.
+        `amount` is given as a positive number; refunds are negated.
+        """
+        kind = kind.lower()
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown payment kind {kind!r}")
+
+        amount = round(float(amount), 2)
+        if amount <= 0:
+            raise ValueError("Amount must be greater than zero")
+
+        order = self.order_manager.get_order(order_id)
+        if order is None:
+            raise KeyError(f"No order with id {order_id}")
+        if order.get("kind") != "sale":
+            raise ValueError(f"Order {order_id} is not a sale order")
+
+        now = datetime.now()
+        with self._lock.write_lock():
+            entry = {
+                "id": self._next_id(),
+                "order_id": order_id,
+                "kind": kind,
+                "amount": -amount if kind == "refund" else amount,
+                "method": method,
+                "date": date or now.date().isoformat(),
+                "created_at": now.isoformat(),
+                "notes": notes,
+            }
+            self._append(entry)
+            self._apply(entry)
+            return entry
+
+    def paid_for_order(self, order_id: int) -> float:
+        """Net amount received against an order."""
+        with self._lock.read_lock():
+            return self._paid_by_order.get(order_id, 0.0)
+
+    def outstanding_for_order(self, order_id: int) -> float:
+        """Order total minus everything paid so far."""
+        order = self.order_manager.get_order(order_id)
+        if order is None:
+            raise KeyError(f"No order with id {order_id}")
+        return round(self._order_total(order) - self.paid_for_order(order_id), 2)
+
+    def takings_for_day(self, day: Optional[str] = None) -> float:
+        """Net takings for a day ("YYYY-MM-DD"), today by default."""
+        day = day or datetime.now().date().isoformat()
+        with self._lock.read_lock():
+            return self._takings_by_day.get(day, 0.0)
+
+    def count(self) -> int:
+        with self._lock.read_lock():
+            return len(self.entries)
+
+    def get_page(self, limit: int = 50, cursor: Optional[int] = None) -> Tuple[List[Dict], Optional[int]]:
+        """
+        Return (entries, next_cursor) for one page, newest first.
+
+        The cursor is the id of the oldest entry on the previous page; the
+        next page holds the entries just before it. Ids only grow, so new
+        payments never shift pages that were already handed out.
+        next_cursor is None on the last page.
+        """
+        if limit <= 0:
+            raise ValueError("limit must be greater than zero")
+        if cursor is not None and (not isinstance(cursor, int) or isinstance(cursor, bool)):
+            raise ValueError("Invalid page cursor")
+
+        with self._lock.read_lock():
+            end = len(self._ids) if cursor is None else bisect.bisect_left(self._ids, cursor)
+            start = max(end - limit, 0)
+            page = self.entries[start:end][::-1]
+        next_cursor = page[-1]["id"] if start > 0 else None
+        return page, next_cursor
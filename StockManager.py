@@ -1,9 +1,12 @@
 # stock_manager.py
 import json
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Tuple
 from datetime import datetime
 
+from Paging import paginate
+from RWLock import RWLock, NullLock
+
 
 class StockManager:
     """
@@ -16,11 +19,17 @@ class StockManager:
         "quantity": int,
         "unit_price": float
     }
+
+    Pass thread_safe=True when the manager is shared with background
+    threads: reads then run under a shared lock and writes under an
+    exclusive one. Updates replace the item dict rather than mutating it,
+    so lists returned by get_all() are consistent snapshots.
     """
 
-    def __init__(self, filepath: str = "data/stock.json"):
+    def __init__(self, filepath: str = "data/stock.json", thread_safe: bool = False):
         self.filepath = Path(filepath)
         self.items: List[Dict] = []
+        self._lock = RWLock() if thread_safe else NullLock()
         self._load()
 
     # ---------- internal helpers ----------
@@ -73,45 +82,72 @@ class StockManager:
 
     def get_all(self) -> List[Dict]:
         """Return a copy of all items."""
-        return list(self.items)
+        with self._lock.read_lock():
+            return list(self.items)
 
     def add_item(self, name: str, quantity: int, unit_price: float, item_type: str = "") -> Dict:
         """Add a new stock item and save to file."""
-        new_item = {
-            "id": self._next_id(),
-            "name": name,
-            "quantity": int(quantity),
-            "unit_price": float(unit_price),
-            "type": item_type,
-            "date_added": datetime.now().isoformat(),
-        }
-        self.items.append(new_item)
-        self._save()
-        return new_item
+        with self._lock.write_lock():
+            new_item = {
+                "id": self._next_id(),
+                "name": name,
+                "quantity": int(quantity),
+                "unit_price": float(unit_price),
+                "type": item_type,
+                "date_added": datetime.now().isoformat(),
+            }
+            self.items.append(new_item)
+            self._save()
+            return new_item
 
     def update_item(self, item_id: int, **fields) -> Dict:
         """
         Update fields of an item by id, e.g.:
         manager.update_item(3, quantity=20, unit_price=1.99)
         """
-        idx = self._find_index_by_id(item_id)
-        if idx is None:
-            raise KeyError(f"No item with id {item_id}")
+        with self._lock.write_lock():
+            idx = self._find_index_by_id(item_id)
+            if idx is None:
+                raise KeyError(f"No item with id {item_id}")
 
-        self.items[idx].update(fields)
-        self._save()
-        return self.items[idx]
+            # copy-on-write so snapshots handed out earlier stay unchanged
+            self.items[idx] = {**self.items[idx], **fields}
+            self._save()
+            return self.items[idx]
 
     def delete_item(self, item_id: int) -> None:
         """Delete an item by id."""
-        idx = self._find_index_by_id(item_id)
-        if idx is None:
-            raise KeyError(f"No item with id {item_id}")
-
-        del self.items[idx]
-        self._save()
+        with self._lock.write_lock():
+            idx = self._find_index_by_id(item_id)
+            if idx is None:
+                raise KeyError(f"No item with id {item_id}")
+
+            del self.items[idx]
+            self._save()
+
+    def page(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        sort_key: str = "id",
+        descending: bool = False,
+        where: Optional[Callable[[Dict], bool]] = None,
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Return (items, next_cursor) for one page, e.g.:
+        items, cursor = manager.page(limit=50, sort_key="name")
+        items, cursor = manager.page(cursor=cursor, limit=50, sort_key="name")
+        Pass the returned cursor back (with the same sort) for the next
+        page; it is None on the last page.
+        """
+        # filter a snapshot outside the lock so `where` may call back into the manager
+        with self._lock.read_lock():
+            snapshot = list(self.items)
+        return paginate(snapshot, limit, cursor, offset, sort_key, descending, where)
 
     def get_item(self, item_id: int) -> Optional[Dict]:
         """Return a single item by id (or None if not found)."""
-        idx = self._find_index_by_id(item_id)
-        return self.items[idx] if idx is not None else None
+        with self._lock.read_lock():
+            idx = self._find_index_by_id(item_id)
+            return self.items[idx] if idx is not None else None
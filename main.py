@@ -1,19 +1,59 @@
+import queue
+import sys
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, simpledialog
 
 from OrderManager import OrderManager      # DATA manager (JSON etc.)
+from PaymentManager import PaymentManager  # DATA manager for payments ledger
 from StockManager import StockManager      # DATA manager for stock
 
 
+class TkDispatcher:
+    """
+    Lets background threads hand work back to the Tk thread.
+
+    Tk widgets must only be touched from the thread running mainloop(),
+    so worker threads call post(callback, *args) and the Tk thread drains
+    the queue every `interval_ms` via after().
+    """
+
+    def __init__(self, root: tk.Tk, interval_ms: int = 50):
+        self.root = root
+        self.interval_ms = interval_ms
+        self._queue: "queue.Queue" = queue.Queue()
+        self.root.after(self.interval_ms, self._drain)
+
+    def post(self, callback, *args) -> None:
+        """Queue callback(*args) to run on the Tk thread (safe from any thread)."""
+        self._queue.put((callback, args))
+
+    def _drain(self):
+        while True:
+            try:
+                callback, args = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception:
+                # report it like any other Tk callback error and keep draining
+                self.root.report_callback_exception(*sys.exc_info())
+        self.root.after(self.interval_ms, self._drain)
+
+
 class MainMenu(tk.Tk):
     def __init__(self):
         super().__init__()
         self.title("Business System - Main Menu")
         self.geometry("400x250")
 
-        # shared managers
-        self.stock_manager = StockManager("data/stock.json")
-        self.order_manager = OrderManager()   # <--- create this!
+        # shared managers (thread-safe so background workers can use them)
+        self.stock_manager = StockManager("data/stock.json", thread_safe=True)
+        self.order_manager = OrderManager(thread_safe=True)
+        self.payment_manager = PaymentManager(self.order_manager, thread_safe=True)
+
+        # background threads post GUI updates through this
+        self.dispatcher = TkDispatcher(self)
 
         self._build_ui()
 
@@ -37,7 +77,7 @@ class MainMenu(tk.Tk):
 
         ttk.Button(
             frame,
-            text="Payments (todo)",
+            text="Payments",
             command=self.open_payments_window
         ).pack(fill="x", pady=5)
 
@@ -55,12 +95,69 @@ class MainMenu(tk.Tk):
         OrdersWindow(self, self.order_manager)
 
     def open_payments_window(self):
-        messagebox.showinfo("Payments", "Payments window not implemented yet.", parent=self)
+        PaymentsWindow(self, self.payment_manager)
+
+
+# ================== PAGING CONTROLS ==================
+
+class Pager(ttk.Frame):
+    """
+    Prev / "Page N" / Next controls shared by the list windows.
+
+    `load(position)` fills the window with the page starting at `position`
+    (a cursor, or an offset) and returns the position of the next page,
+    or None when it was the last one. The pager remembers where each
+    visited page started, so Prev goes back exactly one page.
+    """
+
+    def __init__(self, parent, load, first=None):
+        super().__init__(parent)
+        self.load = load
+        self.first = first
+        self.positions = [first]
+        self.next_position = None
+        # set by `load` when the total is known, shown as "Page N of M"
+        self.page_count = None
+
+        self.prev_btn = ttk.Button(self, text="< Prev", command=self.on_prev_page)
+        self.prev_btn.pack(side="left")
+        self.page_var = tk.StringVar()
+        ttk.Label(self, textvariable=self.page_var).pack(side="left", padx=10)
+        self.next_btn = ttk.Button(self, text="Next >", command=self.on_next_page)
+        self.next_btn.pack(side="left")
+
+    def refresh(self):
+        """Reload the current page."""
+        self.next_position = self.load(self.positions[-1])
+
+        label = f"Page {len(self.positions)}"
+        if self.page_count is not None:
+            label += f" of {self.page_count}"
+        self.page_var.set(label)
+        self.prev_btn.state(["!disabled"] if len(self.positions) > 1 else ["disabled"])
+        self.next_btn.state(["!disabled"] if self.next_position is not None else ["disabled"])
+
+    def reset(self):
+        """Go back to the first page (e.g. after the filter changed)."""
+        self.positions = [self.first]
+        self.refresh()
+
+    def on_prev_page(self):
+        if len(self.positions) > 1:
+            self.positions.pop()
+            self.refresh()
+
+    def on_next_page(self):
+        if self.next_position is not None:
+            self.positions.append(self.next_position)
+            self.refresh()
 
 
 # ================== STOCK WINDOW ==================
 
 class StockApp(tk.Toplevel):
+    PAGE_SIZE = 50
+
     def __init__(self, parent, manager: StockManager):
         super().__init__(parent)
         self.transient(parent)
@@ -89,6 +186,10 @@ class StockApp(tk.Toplevel):
         self.tree.bind("<Button-3>", self._on_right_click)  # Windows/Linux
         self.tree.bind("<Button-2>", self._on_right_click)  # macOS (middle/right)
 
+        # Paging controls
+        self.pager = Pager(self, self._load_page)
+        self.pager.pack(fill="x", padx=10)
+
         # Add-item form
         form = ttk.Frame(self)
         form.pack(fill="x", padx=10, pady=5)
@@ -134,12 +235,18 @@ class StockApp(tk.Toplevel):
                 self.context_menu.grab_release()
 
     def _load_items_into_tree(self):
+        self.pager.refresh()
+
+    def _load_page(self, cursor):
         # Clear existing rows
         for row in self.tree.get_children():
             self.tree.delete(row)
 
-        # Insert rows from StockManager
-        for item in self.stock_manager.get_all():
+        # Insert one page of rows from StockManager, newest first
+        items, next_cursor = self.stock_manager.page(
+            limit=self.PAGE_SIZE, cursor=cursor, descending=True
+        )
+        for item in items:
             self.tree.insert(
                 "",
                 "end",
@@ -152,6 +259,7 @@ class StockApp(tk.Toplevel):
                     item.get("date_added", ""),
                 ),
             )
+        return next_cursor
 
     def on_add_item(self):
         item_type = self.type_var.get().strip()
@@ -176,7 +284,8 @@ class StockApp(tk.Toplevel):
         self.name_var.set("")
         self.qty_var.set("")
         self.price_var.set("")
-        self._load_items_into_tree()
+        # jump to the first page, where the new item now is
+        self.pager.reset()
 
     # --------- context menu callbacks ---------
 
@@ -311,6 +420,8 @@ class EditItemDialog(tk.Toplevel):
 # ================== ORDERS WINDOW ==================
 
 class OrdersWindow(tk.Toplevel):
+    PAGE_SIZE = 50
+
     def __init__(self, parent, order_manager: OrderManager):
         super().__init__(parent)
         self.title("Order / Sales Manager")
@@ -319,6 +430,7 @@ class OrdersWindow(tk.Toplevel):
         self.order_manager = order_manager
 
         self._build_ui()
+        self._build_context_menu()
         self._load_orders()
 
         self.transient(parent)
@@ -338,7 +450,7 @@ class OrdersWindow(tk.Toplevel):
             state="readonly",
         )
         filter_box.pack(side="left", padx=5)
-        filter_box.bind("<<ComboboxSelected>>", lambda e: self._load_orders())
+        filter_box.bind("<<ComboboxSelected>>", lambda e: self._on_filter_changed())
 
         # Treeview
         columns = (
@@ -350,6 +462,7 @@ class OrdersWindow(tk.Toplevel):
             "by_who",
             "date",
             "status",
+            "total",
         )
         self.tree = ttk.Treeview(self, columns=columns, show="headings", height=12)
         for col in columns:
@@ -357,6 +470,14 @@ class OrdersWindow(tk.Toplevel):
             self.tree.column(col, width=110, anchor="center")
         self.tree.pack(fill="both", expand=True, padx=10, pady=5)
 
+        # Right-click bindings
+        self.tree.bind("<Button-3>", self._on_right_click)  # Windows/Linux
+        self.tree.bind("<Button-2>", self._on_right_click)  # macOS (middle/right)
+
+        # Paging controls
+        self.pager = Pager(self, self._load_page)
+        self.pager.pack(fill="x", padx=10)
+
         # Simple form to add new order
         form = ttk.LabelFrame(self, text="Add new order")
         form.pack(fill="x", padx=10, pady=5)
@@ -427,8 +548,16 @@ class OrdersWindow(tk.Toplevel):
             state="readonly",
         ).grid(row=2, column=1, padx=5, pady=2)
 
-        ttk.Entry(form, textvariable=self.notes_var, width=40).grid(
-            row=2, column=3, columnspan=3, padx=5, pady=2, sticky="w"
+        ttk.Entry(form, textvariable=self.notes_var, width=25).grid(
+            row=2, column=3, padx=5, pady=2
+        )
+
+        ttk.Label(form, text="Total").grid(
+            row=2, column=4, padx=5, pady=2, sticky="e"
+        )
+        self.total_var = tk.StringVar()
+        ttk.Entry(form, textvariable=self.total_var, width=12).grid(
+            row=2, column=5, padx=5, pady=2
         )
 
         ttk.Button(form, text="Add", command=self.on_add).grid(
@@ -436,17 +565,21 @@ class OrdersWindow(tk.Toplevel):
         )
 
     def _load_orders(self):
+        self.pager.refresh()
+
+    def _load_page(self, cursor):
         # Clear
         for row in self.tree.get_children():
             self.tree.delete(row)
 
         filt = self.filter_var.get()
-        if filt == "sale":
-            orders = self.order_manager.get_by_kind("sale")
-        elif filt == "parts":
-            orders = self.order_manager.get_by_kind("parts")
-        else:
-            orders = self.order_manager.get_all()
+        where = None
+        if filt in ("sale", "parts"):
+            where = lambda o: o.get("kind") == filt
+
+        orders, next_cursor = self.order_manager.page(
+            limit=self.PAGE_SIZE, cursor=cursor, descending=True, where=where
+        )
 
         for o in orders:
             self.tree.insert(
@@ -461,8 +594,54 @@ class OrdersWindow(tk.Toplevel):
                     o["by_who"],
                     o["date"],
                     o["status"],
+                    o.get("total", 0.0),
                 ),
             )
+        return next_cursor
+
+    def _build_context_menu(self):
+        self.context_menu = tk.Menu(self, tearoff=0)
+        self.context_menu.add_command(label="Set total...", command=self.on_set_total)
+
+    def _on_right_click(self, event):
+        row_id = self.tree.identify_row(event.y)
+        if row_id:
+            self.tree.selection_set(row_id)
+            try:
+                self.context_menu.tk_popup(event.x_root, event.y_root)
+            finally:
+                self.context_menu.grab_release()
+
+    def on_set_total(self):
+        selection = self.tree.selection()
+        if not selection:
+            return
+        order_id = int(self.tree.item(selection[0])["values"][0])
+
+        order = self.order_manager.get_order(order_id)
+        if not order:
+            messagebox.showerror("Error", "Order no longer exists.", parent=self)
+            return
+
+        total = simpledialog.askfloat(
+            "Set total",
+            f"Total for order #{order_id}:",
+            initialvalue=order.get("total", 0.0),
+            minvalue=0.0,
+            parent=self,
+        )
+        if total is None:
+            return
+
+        try:
+            self.order_manager.update_order(order_id, total=total)
+        except KeyError:
+            messagebox.showerror("Error", "Order no longer exists.", parent=self)
+        self._load_orders()
+
+    def _on_filter_changed(self):
+        # a different filter means different pages - start from the first one
+        self.pager.reset()
 
     def on_add(self):
         title = self.title_var.get().strip()
@@ -473,11 +652,18 @@ class OrdersWindow(tk.Toplevel):
         date = self.date_var.get().strip()
         status = self.status_var.get().strip()
         notes = self.notes_var.get().strip()
+        total_text = self.total_var.get().strip()
 
         if not title:
             messagebox.showerror("Error", "Title is required.", parent=self)
             return
 
+        try:
+            total = float(total_text) if total_text else 0.0
+        except ValueError:
+            messagebox.showerror("Error", "Total must be a number.", parent=self)
+            return
+
         self.order_manager.add_order(
             kind=kind,
             title=title,
@@ -487,16 +673,176 @@ class OrdersWindow(tk.Toplevel):
             date=date,
             status=status,
             notes=notes,
+            total=total,
         )
 
-        # clear fields & reload list
+        # clear fields & go back to the first page, where the new order is
         self.title_var.set("")
         self.contact_var.set("")
         self.from_where_var.set("")
         self.by_who_var.set("")
         self.date_var.set("")
         self.notes_var.set("")
-        self._load_orders()
+        self.total_var.set("")
+        self.pager.reset()
+
+
+# ================== PAYMENTS WINDOW ==================
+
+class PaymentsWindow(tk.Toplevel):
+    PAGE_SIZE = 50
+
+    def __init__(self, parent, payment_manager: PaymentManager):
+        super().__init__(parent)
+        self.title("Payments")
+        self.geometry("800x450")
+
+        self.payment_manager = payment_manager
+
+        self._build_ui()
+        self.pager.refresh()
+
+        self.transient(parent)
+
+    def _build_ui(self):
+        # Summary bar
+        top = ttk.Frame(self)
+        top.pack(fill="x", padx=10, pady=5)
+
+        self.takings_var = tk.StringVar()
+        ttk.Label(top, textvariable=self.takings_var).pack(side="left")
+
+        self.balance_var = tk.StringVar()
+        ttk.Label(top, textvariable=self.balance_var).pack(side="right")
+        ttk.Button(top, text="Check balance", command=self.on_check_balance).pack(side="right", padx=5)
+        self.lookup_var = tk.StringVar()
+        ttk.Entry(top, textvariable=self.lookup_var, width=8).pack(side="right")
+        ttk.Label(top, text="Order id").pack(side="right", padx=5)
+
+        # Treeview (one page of the ledger at a time, newest first)
+        columns = ("id", "order_id", "kind", "amount", "method", "date", "notes")
+        self.tree = ttk.Treeview(self, columns=columns, show="headings", height=12)
+        for col in columns:
+            self.tree.heading(col, text=col.replace("_", " ").capitalize())
+            self.tree.column(col, width=100, anchor="center")
+        self.tree.pack(fill="both", expand=True, padx=10, pady=5)
+
+        # Paging controls
+        self.pager = Pager(self, self._load_page)
+        self.pager.pack(fill="x", padx=10)
+
+        # Form to record a payment
+        form = ttk.LabelFrame(self, text="Record payment")
+        form.pack(fill="x", padx=10, pady=5)
+
+        ttk.Label(form, text="Order id").grid(row=0, column=0, padx=5, pady=2, sticky="e")
+        ttk.Label(form, text="Kind").grid(row=0, column=2, padx=5, pady=2, sticky="e")
+        ttk.Label(form, text="Amount").grid(row=0, column=4, padx=5, pady=2, sticky="e")
+        ttk.Label(form, text="Method").grid(row=1, column=0, padx=5, pady=2, sticky="e")
+        ttk.Label(form, text="Notes").grid(row=1, column=2, padx=5, pady=2, sticky="e")
+
+        self.order_id_var = tk.StringVar()
+        self.kind_var = tk.StringVar(value="payment")
+        self.amount_var = tk.StringVar()
+        self.method_var = tk.StringVar(value="card")
+        self.notes_var = tk.StringVar()
+
+        ttk.Entry(form, textvariable=self.order_id_var, width=8).grid(row=0, column=1, padx=5, pady=2)
+        ttk.Combobox(
+            form,
+            textvariable=self.kind_var,
+            values=list(PaymentManager.KINDS),
+            width=10,
+            state="readonly",
+        ).grid(row=0, column=3, padx=5, pady=2)
+        ttk.Entry(form, textvariable=self.amount_var, width=10).grid(row=0, column=5, padx=5, pady=2)
+        ttk.Combobox(
+            form,
+            textvariable=self.method_var,
+            values=["cash", "card", "transfer", "other"],
+            width=10,
+            state="readonly",
+        ).grid(row=1, column=1, padx=5, pady=2)
+        ttk.Entry(form, textvariable=self.notes_var, width=30).grid(
+            row=1, column=3, columnspan=3, padx=5, pady=2, sticky="w"
+        )
+
+        ttk.Button(form, text="Add", command=self.on_add).grid(
+            row=0, column=6, rowspan=2, padx=10
+        )
+
+    def _load_page(self, cursor):
+        # Clear
+        for row in self.tree.get_children():
+            self.tree.delete(row)
+
+        entries, next_cursor = self.payment_manager.get_page(self.PAGE_SIZE, cursor)
+        for e in entries:
+            self.tree.insert(
+                "",
+                "end",
+                values=(
+                    e["id"],
+                    e["order_id"],
+                    e["kind"],
+                    f"{e['amount']:.2f}",
+                    e["method"],
+                    e["date"],
+                    e["notes"],
+                ),
+            )
+
+        total = self.payment_manager.count()
+        self.pager.page_count = max((total + self.PAGE_SIZE - 1) // self.PAGE_SIZE, 1)
+        self.takings_var.set(f"Takings today: {self.payment_manager.takings_for_day():.2f}")
+        return next_cursor
+
+    def _show_balance(self, order_id: int):
+        try:
+            outstanding = self.payment_manager.outstanding_for_order(order_id)
+        except KeyError:
+            messagebox.showerror("Error", f"No order with id {order_id}.", parent=self)
+            return
+        paid = self.payment_manager.paid_for_order(order_id)
+        self.balance_var.set(f"Paid: {paid:.2f}  Outstanding: {outstanding:.2f}")
+
+    def on_check_balance(self):
+        try:
+            order_id = int(self.lookup_var.get().strip())
+        except ValueError:
+            messagebox.showerror("Error", "Order id must be an integer.", parent=self)
+            return
+        self._show_balance(order_id)
+
+    def on_add(self):
+        try:
+            order_id = int(self.order_id_var.get().strip())
+            amount = float(self.amount_var.get().strip())
+        except ValueError:
+            messagebox.showerror("Error", "Order id must be an integer and amount a number.", parent=self)
+            return
+
+        try:
+            self.payment_manager.add_entry(
+                order_id,
+                amount,
+                kind=self.kind_var.get().strip(),
+                method=self.method_var.get().strip(),
+                notes=self.notes_var.get().strip(),
+            )
+        except KeyError:
+            messagebox.showerror("Error", f"No order with id {order_id}.", parent=self)
+            return
+        except ValueError as e:
+            messagebox.showerror("Error", str(e), parent=self)
+            return
+
+        # clear fields, jump back to the newest entries & show the order's balance
+        self.amount_var.set("")
+        self.notes_var.set("")
+        self.lookup_var.set(str(order_id))
+        self._show_balance(order_id)
+        self.pager.reset()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,147 @@
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from OrderManager import OrderManager  # noqa: E402
+from StockManager import StockManager  # noqa: E402
+
+
+class PagingTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.stock = StockManager(os.path.join(self._tmp.name, "stock.json"), thread_safe=True)
+        for i in range(25):
+            self.stock.add_item(f"item-{i % 7}", i, 1.0)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _all_pages(self, **kwargs):
+        seen, cursor = [], None
+        while True:
+            page, cursor = self.stock.page(limit=10, cursor=cursor, **kwargs)
+            seen.extend(page)
+            if cursor is None:
+                return seen
+
+    def test_cursor_is_stable_under_inserts(self):
+        first, cursor = self.stock.page(limit=10, sort_key="name")
+        before = self.stock.add_item("aaa", 1, 1.0)   # sorts before the cursor
+        after = self.stock.add_item("zzz", 1, 1.0)    # sorts after it
+
+        rest = []
+        while cursor is not None:
+            page, cursor = self.stock.page(limit=10, cursor=cursor, sort_key="name")
+            rest.extend(page)
+
+        ids = [i["id"] for i in first + rest]
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertIn(after["id"], ids)
+        self.assertNotIn(before["id"], ids)
+        self.assertEqual(len(ids), 26)
+
+    def test_offset_and_descending(self):
+        page, _ = self.stock.page(limit=5, offset=20, descending=True)
+        self.assertEqual([i["id"] for i in page], [5, 4, 3, 2, 1])
+
+    def test_rejects_bad_arguments(self):
+        with self.assertRaises(ValueError):
+            self.stock.page(offset=-1)
+        with self.assertRaises(ValueError):
+            self.stock.page(limit=0)
+        _, cursor = self.stock.page(limit=5, sort_key="name")
+        with self.assertRaises(ValueError):
+            self.stock.page(cursor=cursor, sort_key="quantity")
+
+    def test_mixed_types_in_sort_field(self):
+        self.stock.update_item(3, quantity="x")
+        self.stock.update_item(4, quantity=None)
+        seen = self._all_pages(sort_key="quantity")
+        self.assertEqual(len(seen), 25)
+        # numbers first, then strings, then everything else
+        self.assertEqual([i["id"] for i in seen[-2:]], [3, 4])
+
+    def test_where_may_call_back_into_manager(self):
+        writer = threading.Thread(target=self.stock.add_item, args=("late", 1, 1.0), daemon=True)
+        result = []
+
+        def where(item):
+            if not writer.is_alive() and not result:
+                # a writer queues up while the filter is running
+                writer.start()
+                result.append("started")
+            return self.stock.get_item(item["id"]) is not None
+
+        def reader():
+            page, _ = self.stock.page(limit=100, where=where)
+            result.append(page)
+
+        # run in a thread so a deadlock fails the test instead of hanging it
+        thread = threading.Thread(target=reader, daemon=True)
+        thread.start()
+        thread.join(timeout=5)
+        writer.join(timeout=5)
+        self.assertFalse(thread.is_alive(), "page() deadlocked")
+        self.assertEqual(len(result[-1]), 25)
+
+    def test_malformed_cursors_raise_value_error(self):
+        bad = [
+            "not json",
+            '{"sort_key": "id", "desc": false}',
+            '{"sort_key": "id", "desc": false, "after": [0, "x", 1]}',
+            '{"sort_key": "id", "desc": false, "after": [1, 5, 1]}',
+            '{"sort_key": "id", "desc": false, "after": [7, 1, 1]}',
+            '{"sort_key": "id", "desc": false, "after": [[0], 1, 1]}',
+            '{"sort_key": "id", "desc": false, "after": [0, 1, "1"]}',
+        ]
+        for cursor in bad:
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(ValueError):
+                    self.stock.page(cursor=cursor)
+
+
+class OrderPagingTest(unittest.TestCase):
+    def setUp(self):
+        self._old_cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        # OrderManager always writes to ./data/
+        os.chdir(self._tmp.name)
+        self.orders = OrderManager(thread_safe=True)
+        for i in range(30):
+            kind = "sale" if i % 3 else "parts"
+            self.orders.add_order(kind, f"order-{i}", "c", "", "", "2025-01-31", "open")
+
+    def tearDown(self):
+        os.chdir(self._old_cwd)
+        self._tmp.cleanup()
+
+    def test_kind_filter_with_cursor(self):
+        def is_sale(o):
+            return o.get("kind") == "sale"
+
+        first, cursor = self.orders.page(limit=8, descending=True, where=is_sale)
+        # a new sale lands before the cursor and must not show up later
+        new = self.orders.add_order("sale", "new", "c", "", "", "2025-02-01", "open")
+
+        seen = list(first)
+        while cursor is not None:
+            page, cursor = self.orders.page(limit=8, cursor=cursor, descending=True, where=is_sale)
+            seen.extend(page)
+
+        ids = [o["id"] for o in seen]
+        expected = [o["id"] for o in reversed(self.orders.get_by_kind("sale")) if o["id"] != new["id"]]
+        self.assertEqual(ids, expected)
+        self.assertEqual(len(ids), 20)
+        self.assertTrue(all(o["kind"] == "sale" for o in seen))
+
+        newest, _ = self.orders.page(limit=1, descending=True, where=is_sale)
+        self.assertEqual(newest[0]["id"], new["id"])
+
+
+if __name__ == "__main__":
+    unittest.main()
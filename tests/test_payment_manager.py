@@ -0,0 +1,117 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from OrderManager import OrderManager  # noqa: E402
+from PaymentManager import PaymentManager  # noqa: E402
+
+
+class PaymentManagerTest(unittest.TestCase):
+    def setUp(self):
+        self._old_cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        # OrderManager always writes to ./data/
+        os.chdir(self._tmp.name)
+        self.orders = OrderManager()
+        self.sale = self.orders.add_order(
+            "sale", "PC build", "Bob", "", "", "2025-01-31", "open", total=100.0
+        )
+        self.path = Path("data/payments.jsonl")
+
+    def tearDown(self):
+        os.chdir(self._old_cwd)
+        self._tmp.cleanup()
+
+    def test_running_balances(self):
+        pm = PaymentManager(self.orders)
+        pm.add_entry(self.sale["id"], 30, "deposit", date="2025-02-01")
+        pm.add_entry(self.sale["id"], 20, date="2025-02-01")
+        pm.add_entry(self.sale["id"], 5, "refund", date="2025-02-02")
+
+        self.assertEqual(pm.paid_for_order(self.sale["id"]), 45.0)
+        self.assertEqual(pm.outstanding_for_order(self.sale["id"]), 55.0)
+        self.assertEqual(pm.takings_for_day("2025-02-01"), 50.0)
+        self.assertEqual(pm.takings_for_day("2025-02-02"), -5.0)
+
+        reloaded = PaymentManager(self.orders)
+        self.assertEqual(reloaded.paid_for_order(self.sale["id"]), 45.0)
+        self.assertEqual(reloaded.count(), 3)
+
+    def test_rejects_parts_orders(self):
+        parts = self.orders.add_order("parts", "GPU", "Supplier", "", "", "2025-01-31", "ordered")
+        pm = PaymentManager(self.orders)
+        with self.assertRaises(ValueError):
+            pm.add_entry(parts["id"], 10)
+        with self.assertRaises(KeyError):
+            pm.add_entry(999, 10)
+
+    def test_half_written_tail_does_not_swallow_next_entry(self):
+        pm = PaymentManager(self.orders)
+        pm.add_entry(self.sale["id"], 10)
+        # simulate a crash in the middle of writing the second line
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write('{"id": 2, "order_id": ')
+
+        pm = PaymentManager(self.orders)
+        self.assertEqual(pm.count(), 1)
+        pm.add_entry(self.sale["id"], 20)
+
+        reloaded = PaymentManager(self.orders)
+        self.assertEqual(reloaded.count(), 2)
+        self.assertEqual(reloaded.paid_for_order(self.sale["id"]), 30.0)
+
+    def test_missing_trailing_newline_is_repaired(self):
+        pm = PaymentManager(self.orders)
+        pm.add_entry(self.sale["id"], 10)
+        self.path.write_text(self.path.read_text(encoding="utf-8").rstrip("\n"), encoding="utf-8")
+
+        PaymentManager(self.orders).add_entry(self.sale["id"], 20)
+        self.assertEqual(PaymentManager(self.orders).count(), 2)
+
+    def test_invalid_entries_are_skipped(self):
+        self.path.parent.mkdir(exist_ok=True)
+        self.path.write_text('{"id": 1}\n[1, 2]\n', encoding="utf-8")
+
+        pm = PaymentManager(self.orders)
+        self.assertEqual(pm.count(), 0)
+        entry = pm.add_entry(self.sale["id"], 10)
+        # the skipped entry's id is not reused
+        self.assertEqual(entry["id"], 2)
+
+
+    def test_pages_are_stable_when_entries_arrive(self):
+        pm = PaymentManager(self.orders)
+        for _ in range(120):
+            pm.add_entry(self.sale["id"], 1)
+
+        first, cursor = pm.get_page(limit=50)
+        self.assertEqual([e["id"] for e in first], list(range(120, 70, -1)))
+
+        pm.add_entry(self.sale["id"], 1)   # arrives before Next is pressed
+        second, cursor = pm.get_page(limit=50, cursor=cursor)
+        self.assertEqual([e["id"] for e in second], list(range(70, 20, -1)))
+
+        last, cursor = pm.get_page(limit=50, cursor=cursor)
+        self.assertEqual([e["id"] for e in last], list(range(20, 0, -1)))
+        self.assertIsNone(cursor)
+
+    def test_get_page_rejects_bad_arguments(self):
+        pm = PaymentManager(self.orders)
+        with self.assertRaises(ValueError):
+            pm.get_page(limit=0)
+        with self.assertRaises(ValueError):
+            pm.get_page(limit=10, cursor="5")
+
+    def test_invalid_order_total_counts_as_zero(self):
+        pm = PaymentManager(self.orders)
+        pm.add_entry(self.sale["id"], 10)
+        for total in (None, "abc"):
+            self.orders.update_order(self.sale["id"], total=total)
+            self.assertEqual(pm.outstanding_for_order(self.sale["id"]), -10.0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from OrderManager import OrderManager  # noqa: E402
+from StockManager import StockManager  # noqa: E402
+
+
+WRITERS = 8
+READERS = 8
+ROUNDS = 40
+JOIN_TIMEOUT = 60
+
+
+class ThreadSafetyStressTest(unittest.TestCase):
+    """Hammer shared managers from many threads and check invariants."""
+
+    def setUp(self):
+        self._old_cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        # OrderManager always writes to ./data/
+        os.chdir(self._tmp.name)
+        self.stock = StockManager("data/stock.json", thread_safe=True)
+        self.orders = OrderManager(thread_safe=True)
+        self.errors = []
+
+    def tearDown(self):
+        os.chdir(self._old_cwd)
+        self._tmp.cleanup()
+
+    def _run(self, targets):
+        threads = [threading.Thread(target=t, daemon=True) for t in targets]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=JOIN_TIMEOUT)
+        # a lock-ordering bug should fail the test, not hang the suite
+        self.assertFalse(any(t.is_alive() for t in threads), "threads deadlocked")
+        self.assertEqual(self.errors, [])
+
+    def _check_unique(self, records, where):
+        ids = [r["id"] for r in records]
+        if len(ids) != len(set(ids)):
+            self.errors.append(f"duplicate ids from {where}")
+
+    def _stock_writer(self, n):
+        for i in range(ROUNDS):
+            item = self.stock.add_item(f"item-{n}-{i}", 1, 1.0, item_type="CPU")
+            self.stock.update_item(item["id"], quantity=2)
+            if i % 4 == 0:
+                self.stock.delete_item(item["id"])
+
+    def _order_writer(self, n):
+        for i in range(ROUNDS):
+            kind = "sale" if i % 2 else "parts"
+            self.orders.add_order(kind, f"order-{n}-{i}", "c", "", "", "2025-01-31", "open")
+
+    def _reader(self):
+        for _ in range(ROUNDS * 2):
+            items = self.stock.get_all()
+            self._check_unique(items, "get_all")
+            # a snapshot never holds a half-applied update
+            if any(item["quantity"] not in (1, 2) for item in items):
+                self.errors.append("bad quantity in snapshot")
+
+            self._check_unique(self.orders.get_all(), "orders.get_all")
+            sales = self.orders.get_by_kind("sale")
+            if any(o["kind"] != "sale" for o in sales):
+                self.errors.append("get_by_kind returned another kind")
+
+            seen, cursor = [], None
+            while True:
+                page, cursor = self.stock.page(limit=25, cursor=cursor)
+                seen.extend(page)
+                if cursor is None:
+                    break
+            self._check_unique(seen, "page")
+
+    def test_concurrent_writers_and_readers(self):
+        targets = [lambda n=n: self._stock_writer(n) for n in range(WRITERS)]
+        targets += [lambda n=n: self._order_writer(n) for n in range(WRITERS)]
+        targets += [self._reader for _ in range(READERS)]
+        self._run(targets)
+
+        items = self.stock.get_all()
+        deleted_per_writer = len(range(0, ROUNDS, 4))
+        self.assertEqual(len(items), WRITERS * (ROUNDS - deleted_per_writer))
+        self.assertEqual(len({i["id"] for i in items}), len(items))
+        self.assertTrue(all(i["quantity"] == 2 for i in items))
+
+        orders = self.orders.get_all()
+        self.assertEqual(len(orders), WRITERS * ROUNDS)
+        self.assertEqual(len({o["id"] for o in orders}), len(orders))
+        self.assertEqual(len(self.orders.get_by_kind("sale")), WRITERS * ROUNDS // 2)
+
+        # what's on disk matches memory
+        with open("data/stock.json", encoding="utf-8") as f:
+            self.assertEqual(json.load(f), items)
+        with open("data/orders.json", encoding="utf-8") as f:
+            self.assertEqual(json.load(f), orders)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import sys
+import threading
+import tkinter as tk
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from main import TkDispatcher  # noqa: E402
+
+
+class FakeRoot:
+    """Just enough of tk.Tk for TkDispatcher, so the test runs headless."""
+
+    def __init__(self):
+        self.scheduled = []
+        self.reported = []
+
+    def after(self, ms, func):
+        self.scheduled.append(func)
+
+    def report_callback_exception(self, exc, val, tb):
+        self.reported.append(val)
+
+    def run_pending(self):
+        pending, self.scheduled = self.scheduled, []
+        for func in pending:
+            func()
+
+
+class TkDispatcherTest(unittest.TestCase):
+    def setUp(self):
+        self.root = FakeRoot()
+        self.dispatcher = TkDispatcher(self.root)
+
+    def test_runs_posts_in_order(self):
+        calls = []
+        for i in range(5):
+            self.dispatcher.post(calls.append, i)
+        self.assertEqual(calls, [])   # nothing runs until the Tk thread drains
+
+        self.root.run_pending()
+        self.assertEqual(calls, [0, 1, 2, 3, 4])
+        self.assertEqual(len(self.root.scheduled), 1)
+
+    def test_posts_from_other_threads(self):
+        calls = []
+        threads = [
+            threading.Thread(target=self.dispatcher.post, args=(calls.append, i))
+            for i in range(20)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+
+        self.root.run_pending()
+        self.assertEqual(sorted(calls), list(range(20)))
+
+    def test_error_is_reported_and_draining_continues(self):
+        calls = []
+
+        def boom():
+            raise RuntimeError("boom")
+
+        self.dispatcher.post(calls.append, 1)
+        self.dispatcher.post(boom)
+        self.dispatcher.post(calls.append, 2)
+        self.root.run_pending()
+
+        self.assertEqual(calls, [1, 2])
+        self.assertEqual([str(e) for e in self.root.reported], ["boom"])
+
+        # still rescheduled, so later posts are not dropped
+        self.dispatcher.post(calls.append, 3)
+        self.root.run_pending()
+        self.assertEqual(calls, [1, 2, 3])
+
+
+class TkDispatcherWithTkTest(unittest.TestCase):
+    def setUp(self):
+        try:
+            self.root = tk.Tk()
+        except tk.TclError:
+            self.skipTest("no display available")
+        self.root.withdraw()
+
+    def tearDown(self):
+        self.root.destroy()
+
+    def test_post_from_worker_runs_on_tk_thread(self):
+        dispatcher = TkDispatcher(self.root, interval_ms=10)
+        seen = []
+
+        def on_tk_thread():
+            seen.append(threading.current_thread() is threading.main_thread())
+            self.root.quit()
+
+        threading.Thread(target=dispatcher.post, args=(on_tk_thread,)).start()
+        self.root.after(5000, self.root.quit)
+        self.root.mainloop()
+        self.assertEqual(seen, [True])
+
+
+if __name__ == "__main__":
+    unittest.main()